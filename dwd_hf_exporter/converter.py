@@ -1,63 +1,213 @@
+import io
+import zipfile
+import numpy as np
 import xarray as xr
 from pathlib import Path
-import zipfile
-import tempfile
-import shutil
+from numcodecs import Blosc
+from zarr.storage import MemoryStore, ZipStore
+
+# Bounding box for Trento region
+LAT_MIN, LAT_MAX = 45.7, 46.4
+LON_MIN, LON_MAX = 10.5, 11.9
+
+# bbox index slices per source grid, all files of a grid share the same slices
+_INDEX_CACHE: dict[tuple, tuple[slice, slice]] = {}
+
+# Variables kept in the output, None keeps every variable of the source.
+# Dropping the rest before loading skips their decompression entirely.
+KEEP_VARS = (
+    "t_2m",
+    "td_2m",
+    "relhum_2m",
+    "tot_prec",
+    "u_10m",
+    "v_10m",
+    "pmsl",
+    "clct",
+    "asob_s",
+    "aswdir_s",
+    "aswdifd_s",
+)
+
+# zlib level 4 keeps most of the size win of higher levels at a fraction of the cost
+NETCDF_COMPLEVEL = 4
+
+# Blosc is SIMD-accelerated and multithreaded, much faster than zlib at a similar ratio
+ZARR_COMPRESSOR = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
+
+# Upper bound on threads decompressing the bbox chunks in parallel
+LOAD_WORKERS = 8
+
+# File extension of the artifact produced for each output format
+OUTPUT_EXTENSIONS = {
+    "netcdf": ".nc",
+    "zarr": ".zarr.zip",
+}
 
-def extract(filepath: str) -> str:
+
+def _auto_chunks(da: xr.DataArray) -> tuple[int, ...]:
+    """
+    One chunk per spatial slice: the bbox is small, so keep latitude/longitude
+    whole and split every other dimension (step, isobaricInhPa, ...) per item.
+    """
+    return tuple(
+        size if dim in ("latitude", "longitude") else 1
+        for dim, size in zip(da.dims, da.shape)
+    )
+
+
+def _bbox_slices(lat: np.ndarray, lon: np.ndarray) -> tuple[slice, slice]:
+    """
+    Integer latitude/longitude slices of the bbox, computed once per grid.
+    Bounds are inclusive, as with a label based .sel.
+    """
+    key = (lat.size, float(lat[0]), float(lat[-1]), lon.size, float(lon[0]), float(lon[-1]))
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Handle latitude order (ascending or descending)
+    if lat[0] < lat[-1]:
+        lat_slice = slice(
+            int(np.searchsorted(lat, LAT_MIN, side="left")),
+            int(np.searchsorted(lat, LAT_MAX, side="right")),
+        )
+    else:
+        rev = lat[::-1]
+        lat_slice = slice(
+            int(lat.size - np.searchsorted(rev, LAT_MAX, side="right")),
+            int(lat.size - np.searchsorted(rev, LAT_MIN, side="left")),
+        )
+    lon_slice = slice(
+        int(np.searchsorted(lon, LON_MIN, side="left")),
+        int(np.searchsorted(lon, LON_MAX, side="right")),
+    )
+
+    _INDEX_CACHE[key] = (lat_slice, lon_slice)
+    return lat_slice, lon_slice
+
+
+def _netcdf_encoding(ds: xr.Dataset) -> dict:
+    return {
+        name: {
+            "zlib": True,
+            "shuffle": True,
+            "complevel": NETCDF_COMPLEVEL,
+            "chunksizes": _auto_chunks(da),
+        }
+        for name, da in ds.data_vars.items()
+        if da.ndim > 0
+    }
+
+
+def _zarr_encoding(ds: xr.Dataset) -> dict:
+    return {
+        name: {
+            "compressors": ZARR_COMPRESSOR,
+            "chunks": _auto_chunks(da),
+        }
+        for name, da in ds.data_vars.items()
+        if da.ndim > 0
+    }
+
+
+def _to_netcdf(ds: xr.Dataset) -> io.BytesIO:
+    buf = io.BytesIO()
+    ds.to_netcdf(buf, engine="h5netcdf", encoding=_netcdf_encoding(ds))
+    buf.seek(0)
+    return buf
+
+
+def _to_zarr_zip(ds: xr.Dataset) -> io.BytesIO:
+    """
+    Write a zarr v2 store in memory and pack it as a single .zarr.zip,
+    the same layout as the source archives.
+    """
+    chunks = {}
+    # Drop the encoding inherited from the source archive (its chunks and codecs)
+    ds.drop_encoding().to_zarr(
+        MemoryStore(store_dict=chunks),
+        mode="w",
+        zarr_format=2,
+        consolidated=True,
+        encoding=_zarr_encoding(ds),
+    )
+
+    buf = io.BytesIO()
+    # Chunks are already compressed, store them as is
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for key, value in chunks.items():
+            zf.writestr(key, value.to_bytes())
+    buf.seek(0)
+    return buf
+
+
+def extract(
+    filepath: str,
+    output_format: str = "netcdf",
+    keep_vars: tuple[str, ...] | None = KEEP_VARS,
+) -> io.BytesIO:
     """
     Extract and filter ICON-EU data to Trento bounding box.
     
     Args:
         filepath: Path to downloaded .zarr.zip file
+        output_format: "netcdf" (zlib compressed .nc) or "zarr"
+            (blosc/zstd compressed .zarr.zip)
+        keep_vars: Data variables to keep, None keeps all of them
     
     Returns:
-        Path to the converted .nc file
+        In-memory output file, rewound and ready to upload
     """
-    # Bounding box for Trento region
-    lat_min, lat_max = 45.7, 46.4
-    lon_min, lon_max = 10.5, 11.9
+    if output_format not in OUTPUT_EXTENSIONS:
+        raise ValueError(f"Unknown output format: {output_format}")
     
     filename = Path(filepath).name[:-4]
-    # Unzip zarr archive to temp directory
-    temp_dir = tempfile.mkdtemp()
+    # Read the zarr archive in place, only chunks touched by the bbox are inflated
+    store = ZipStore(filepath, mode="r")
     
     try:
-        with zipfile.ZipFile(filepath, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-            
-        zarr_dir = Path(temp_dir)
-        # Open zarr dataset
-        ds = xr.open_zarr(zarr_dir, decode_timedelta=False)
+        # Open zarr dataset, chunks={} keeps arrays dask-lazy on the native zarr chunks
+        ds = xr.open_zarr(store, decode_timedelta=False, chunks={})
         
-        # Handle latitude order (ascending or descending)
-        if ds.latitude.values[0] < ds.latitude.values[-1]:
-            ds_bbox = ds.sel(
-                latitude=slice(lat_min, lat_max),
-                longitude=slice(lon_min, lon_max)
-            )
-        else:
-            ds_bbox = ds.sel(
-                latitude=slice(lat_max, lat_min),
-                longitude=slice(lon_min, lon_max)
-            )
+        # Drop unused variables while still lazy, so they are never read
+        if keep_vars is not None:
+            ds = ds[[v for v in keep_vars if v in ds.data_vars]]
+            if not ds.data_vars:
+                raise ValueError(f"None of {keep_vars} found in {filepath}")
+        
+        # Coordinates come from the in-memory indexes, no array is materialized
+        lat_slice, lon_slice = _bbox_slices(
+            ds.indexes["latitude"].to_numpy(), ds.indexes["longitude"].to_numpy()
+        )
+        ds_bbox = ds.isel(latitude=lat_slice, longitude=lon_slice)
         
         # Check if subset is empty
         if ds_bbox.sizes.get("latitude", 0) == 0 or ds_bbox.sizes.get("longitude", 0) == 0:
             raise ValueError(f"Empty subset for {filepath}")
         
-        # Load into memory to avoid lazy writing issues
-        ds_bbox = ds_bbox.load()
-        
-        # Build output path (same directory as input, .nc extension)
-        input_path = Path(filepath)
-        output_path = input_path.parent / input_path.name.replace(".zarr.zip", ".nc")
+        # Load into memory to avoid lazy writing issues. The bbox overlaps a
+        # handful of chunks, decompress them in parallel (blosc/zlib release the GIL)
+        n_chunks = sum(
+            da.data.npartitions
+            for da in ds_bbox.data_vars.values()
+            if hasattr(da.data, "npartitions")
+        )
+        ds_bbox = ds_bbox.compute(
+            scheduler="threads", num_workers=max(1, min(LOAD_WORKERS, n_chunks))
+        )
         
-        # Save as NetCDF
-        ds_bbox.to_netcdf(output_path)
+        # ICON-EU precision fits in float32, halving the bytes written and uploaded
+        for name, da in list(ds_bbox.data_vars.items()):
+            if da.dtype == np.float64:
+                ds_bbox[name] = da.astype(np.float32)
         
-        return str(output_path)
+        # Save compressed in memory, skipping the local disk
+        if output_format == "zarr":
+            return _to_zarr_zip(ds_bbox)
+        return _to_netcdf(ds_bbox)
         
     finally:
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
\ No newline at end of file
+        # The store opens on first read, a bad archive never gets that far
+        if store._is_open:
+            store.close()
\ No newline at end of file
@@ -1,22 +1,123 @@
 import os
+
+# Enable high performance Xet transfers for the files fetched through
+# hf_hub_download (below RANGED_DOWNLOAD_THRESHOLD, larger files use parallel
+# range requests instead). huggingface_hub reads these at import time, so
+# they must be set before importing it.
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+os.environ["HF_HUB_VERBOSE"] = "2"
+
+import logging
+import multiprocessing
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from s3transfer.manager import TransferManager
 from botocore.exceptions import ClientError
-from huggingface_hub import HfApi, hf_hub_download
+from huggingface_hub import (
+    HfApi,
+    get_hf_file_metadata,
+    get_session,
+    hf_hub_download,
+    hf_hub_url,
+)
+from huggingface_hub.utils import build_hf_headers
+import httpx
 import time
 import converter  # your converter
 
-# Enable HF Transfer for large files
-os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
-os.environ["HF_HUB_VERBOSE"] = "2"
-
 # -------------------------------------------------------------------
 # Load environment variables
 # -------------------------------------------------------------------
 
 load_dotenv()
 
+# Days processed concurrently, each in its own process
+DAY_WORKERS = int(os.getenv("DAY_WORKERS", "4"))
+
+# Workers per pipeline stage within a single day. Conversion runs
+# DAY_WORKERS * CONVERT_WORKERS processes in total; the default of 1 fits the
+# 4 CPU job limit. os.cpu_count() is not used since it reports the node's
+# cores, not the container's limit.
+DOWNLOAD_WORKERS = int(os.getenv("DOWNLOAD_WORKERS", "4"))
+CONVERT_WORKERS = int(os.getenv("CONVERT_WORKERS", "1"))
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "4"))
+
+# Output artifact format, "netcdf" or "zarr" (see converter.OUTPUT_EXTENSIONS)
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "netcdf")
+if OUTPUT_FORMAT not in converter.OUTPUT_EXTENSIONS:
+    raise ValueError(
+        f"Unknown OUTPUT_FORMAT {OUTPUT_FORMAT!r}, "
+        f"expected one of {sorted(converter.OUTPUT_EXTENSIONS)}"
+    )
+
+# Comma separated variables to keep, "all" keeps every variable
+# (defaults to converter.KEEP_VARS)
+KEEP_VARS = os.getenv("KEEP_VARS")
+if KEEP_VARS is None:
+    KEEP_VARS = converter.KEEP_VARS
+elif KEEP_VARS.strip().lower() == "all":
+    KEEP_VARS = None
+else:
+    KEEP_VARS = tuple(v.strip() for v in KEEP_VARS.split(",") if v.strip())
+    if not KEEP_VARS:
+        raise ValueError(
+            "KEEP_VARS lists no variables, unset it for the defaults or use 'all'"
+        )
+
+# Parallel byte-range connections per HF download
+DOWNLOAD_PARTS = int(os.getenv("DOWNLOAD_PARTS", "8"))
+# Files smaller than this are fetched with a single hf_hub_download
+RANGED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+# Retries per byte range, each resumes from the last byte written
+DOWNLOAD_RETRIES = int(os.getenv("DOWNLOAD_RETRIES", "5"))
+
+# Multipart settings for S3 uploads of the converted files
+S3_TRANSFER_CONCURRENCY = int(os.getenv("S3_TRANSFER_CONCURRENCY", "32"))
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=32 * 1024 * 1024,
+    max_concurrency=S3_TRANSFER_CONCURRENCY,
+    use_threads=True,
+)
+
+# -------------------------------------------------------------------
+# Logging
+# -------------------------------------------------------------------
+
+log = logging.getLogger("dwd_hf_exporter")
+
+
+def setup_logging() -> QueueListener:
+    """
+    Workers only enqueue records; a listener thread does the stdout writes,
+    keeping the stream lock out of the per-file hot path. Must run once per
+    process (the parent and each day worker), the caller stops the returned
+    listener to flush pending records.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    # Root keeps its WARNING default, so httpx/botocore INFO chatter stays out
+    logging.basicConfig(
+        handlers=[QueueHandler(log_queue)],
+        format="%(message)s",
+        force=True,
+    )
+    log.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+
 # -------------------------------------------------------------------
 # S3 client factory
 # -------------------------------------------------------------------
@@ -25,6 +126,18 @@ load_dotenv()
 def get_s3_client():
     endpoint = os.getenv("AWS_S3_ENDPOINT")  # optional for MinIO
 
+    # Pool sized for parallel multipart uploads, adaptive retries for throttling.
+    # MinIO and other custom endpoints generally need path-style addressing.
+    config = Config(
+        max_pool_connections=max(64, S3_TRANSFER_CONCURRENCY * 2),
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        tcp_keepalive=True,
+        s3={
+            "use_accelerate_endpoint": False,
+            "addressing_style": "path" if endpoint else "virtual",
+        },
+    )
+
     return boto3.client(
         "s3",
         endpoint_url=endpoint if endpoint else None,
@@ -32,6 +145,7 @@ def get_s3_client():
         aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
         aws_session_token=os.getenv("AWS_SESSION_TOKEN"),
         region_name=os.getenv("AWS_DEFAULT_REGION", "eu-central-1"),
+        config=config,
     )
 
 
@@ -40,16 +154,48 @@ def get_s3_client():
 # -------------------------------------------------------------------
 
 
-def s3_key_exists(s3, bucket: str, key: str) -> bool:
+def list_s3_keys(s3, bucket: str, prefix: str) -> set[str]:
+    """
+    Returns every key under prefix, so existence checks for a whole
+    day cost one paginated listing instead of one HEAD per file.
+    """
+    keys = set()
     try:
-        s3.head_object(Bucket=bucket, Key=key)
-        return True
-    except ClientError:
-        return False
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            keys.update(obj["Key"] for obj in page.get("Contents", []))
+    except ClientError as e:
+        log.warning(f" ⚠️ Could not list S3 prefix {prefix}: {e}")
+    return keys
 
 
-def upload_to_s3(s3, local_path: str, bucket: str, key: str):
-    s3.upload_file(local_path, bucket, key)
+_transfer_manager = None
+_transfer_manager_lock = threading.Lock()
+
+
+def get_transfer_manager() -> TransferManager:
+    """
+    One TransferManager per process, shared by all upload threads, so its
+    executor and warm connections are reused instead of rebuilt per file.
+    Built lazily so it is never inherited across a fork.
+    """
+    global _transfer_manager
+    with _transfer_manager_lock:
+        if _transfer_manager is None:
+            _transfer_manager = TransferManager(get_s3_client(), S3_TRANSFER_CONFIG)
+        return _transfer_manager
+
+
+def upload_to_s3(fileobj: BinaryIO, bucket: str, key: str):
+    get_transfer_manager().upload(fileobj, bucket, key).result()
+
+
+def copy_in_s3(bucket: str, src_key: str, dst_key: str):
+    """
+    Server-side copy within the bucket, switches to multipart UploadPartCopy
+    for large objects (required above 5 GiB). Returns the transfer future.
+    """
+    return get_transfer_manager().copy({"Bucket": bucket, "Key": src_key}, bucket, dst_key)
 
 
 # -------------------------------------------------------------------
@@ -66,14 +212,17 @@ def list_hf_files_for_date(api: HfApi, repo_id: str, date: datetime):
     yyyy, mm, dd = date.year, date.month, date.day
     folder_path = f"data/{yyyy}/{mm}/{dd}"
 
+    # list_repo_tree is lazy, consume it here so request errors are caught
     try:
-        tree = api.list_repo_tree(
-            repo_id=repo_id,
-            repo_type="dataset",
-            path_in_repo=folder_path,
+        tree = list(
+            api.list_repo_tree(
+                repo_id=repo_id,
+                repo_type="dataset",
+                path_in_repo=folder_path,
+            )
         )
     except Exception as e:
-        print(f" ⚠️ Could not list HF directory {folder_path}: {e}")
+        log.warning(f" ⚠️ Could not list HF directory {folder_path}: {e}")
         return []
 
     files = [node.path for node in tree if node.path.endswith(".zarr.zip")]
@@ -81,8 +230,384 @@ def list_hf_files_for_date(api: HfApi, repo_id: str, date: datetime):
     return files
 
 
+def list_hf_files_for_month(api: HfApi, repo_id: str, year: int, month: int):
+    """
+    Returns the .zarr.zip files available under data/YYYY/MM/,
+    grouped by day of month, with a single recursive listing.
+    Returns None if the listing fails, so callers can list per day instead.
+    """
+
+    folder_path = f"data/{year}/{month}"
+
+    try:
+        tree = list(
+            api.list_repo_tree(
+                repo_id=repo_id,
+                repo_type="dataset",
+                path_in_repo=folder_path,
+                recursive=True,
+            )
+        )
+    except Exception as e:
+        log.warning(f" ⚠️ Could not list HF directory {folder_path}: {e}")
+        return None
+
+    files_by_day: dict[int, list[str]] = {}
+    for node in tree:
+        if not node.path.endswith(".zarr.zip"):
+            continue
+        # data/YYYY/MM/DD/<file>.zarr.zip
+        parts = node.path.split("/")
+        try:
+            day = int(parts[3])
+        except (IndexError, ValueError):
+            continue
+        files_by_day.setdefault(day, []).append(node.path)
+
+    return files_by_day
+
+
 # -------------------------------------------------------------------
-# Process one single day (sequential)
+# HF Utility: parallel range download
+# -------------------------------------------------------------------
+
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code == 429 or e.response.status_code >= 500
+    return isinstance(e, httpx.TransportError)
+
+
+def _download_range(
+    url: str,
+    headers: dict,
+    path: str,
+    start: int,
+    end: int,
+    retries: int = DOWNLOAD_RETRIES,
+):
+    fd = os.open(path, os.O_WRONLY)
+    offset = start
+    try:
+        for attempt in range(retries + 1):
+            try:
+                with get_session().stream(
+                    "GET",
+                    url,
+                    headers={**headers, "Range": f"bytes={offset}-{end}"},
+                    follow_redirects=True,
+                ) as r:
+                    r.raise_for_status()
+                    # A server ignoring Range answers 200 with the whole file
+                    if r.status_code != 206:
+                        raise IOError(
+                            f"Range request for bytes {offset}-{end} not honoured: HTTP {r.status_code}"
+                        )
+                    for chunk in r.iter_bytes(1024 * 1024):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                if offset == end + 1:
+                    return
+                error = IOError(f"Short read for bytes {start}-{end}: got {offset - start}")
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
+                error = e
+
+            if attempt == retries:
+                raise error
+            # Back off on throttling and dropped connections, then resume at offset
+            delay = min(2**attempt, 30)
+            log.warning(
+                f" ⚠️ Range {offset}-{end} interrupted ({str(error).splitlines()[0]}), "
+                f"retrying in {delay}s"
+            )
+            time.sleep(delay)
+    finally:
+        os.close(fd)
+
+
+def download_hf_file(
+    repo_id: str,
+    remote_path: str,
+    local_dir: str,
+    force: bool = False,
+    parts: int = DOWNLOAD_PARTS,
+) -> str:
+    """
+    Download a dataset file from HF, splitting large files into `parts`
+    byte ranges fetched over parallel connections.
+
+    Falls back to hf_hub_download for small files or when the size is unknown.
+    """
+    url = hf_hub_url(repo_id, remote_path, repo_type="dataset")
+    headers = build_hf_headers()
+    meta = get_hf_file_metadata(url, headers=headers)
+
+    if not meta.size or meta.size < RANGED_DOWNLOAD_THRESHOLD or parts <= 1:
+        return hf_hub_download(
+            repo_id=repo_id,
+            filename=remote_path,
+            repo_type="dataset",
+            local_dir=local_dir,
+            force_download=force,
+        )
+
+    local_path = os.path.join(local_dir, remote_path)
+    if not force and os.path.exists(local_path) and os.path.getsize(local_path) == meta.size:
+        return local_path
+
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    tmp_path = local_path + ".incomplete"
+    with open(tmp_path, "wb") as f:
+        f.truncate(meta.size)
+
+    # location is the resolved (possibly CDN) URL, no need to redirect per range
+    download_url = meta.location or url
+    # Never send the HF token to another host (signed CDN URLs reject it)
+    if urlparse(download_url).netloc != urlparse(url).netloc:
+        headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+    part_size = -(-meta.size // parts)
+    ranges = [
+        (start, min(start + part_size, meta.size) - 1)
+        for start in range(0, meta.size, part_size)
+    ]
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(_download_range, download_url, headers, tmp_path, start, end)
+                for start, end in ranges
+            ]
+            for future in futures:
+                future.result()
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, local_path)
+    return local_path
+
+
+# -------------------------------------------------------------------
+# Pipeline stages (download -> convert -> upload)
+# -------------------------------------------------------------------
+
+
+def _build_job(
+    remote_path: str, date: datetime, local_root: str, s3_prefix: str
+) -> dict:
+    yyyy, mm, dd = date.year, date.month, date.day
+    filename = os.path.basename(remote_path)
+
+    local_dir = os.path.join(local_root, f"{yyyy}/{mm}/{dd}")
+    os.makedirs(local_dir, exist_ok=True)
+
+    converted_filename = filename.replace(
+        ".zarr.zip", converter.OUTPUT_EXTENSIONS[OUTPUT_FORMAT]
+    )
+
+    return {
+        "date": date,
+        "remote_path": remote_path,
+        "filename": filename,
+        "local_original": os.path.join(local_dir, filename),
+        "converted_s3_key": f"{s3_prefix}/{yyyy}/{mm:02d}/{dd:02d}/{converted_filename}",
+    }
+
+
+def _download_stage(
+    job: dict, repo_id: str, force: bool, dryrun: bool
+) -> str | None:
+    """
+    Returns a final result string if the file leaves the pipeline here,
+    None if it must go on to conversion.
+    """
+    date, filename = job["date"], job["filename"]
+    remote_path = job["remote_path"]
+
+    log.info(f"\n → Processing file: {filename}")
+
+    # 3. Download
+    log.info(f"   Downloading HF file: {remote_path}")
+    try:
+        temp_local_dir = "./"
+        if not dryrun:
+            job["downloaded_path"] = download_hf_file(
+                repo_id=repo_id,
+                remote_path=remote_path,
+                local_dir=temp_local_dir,
+                force=force,
+            )
+        else:
+            job["downloaded_path"] = job["local_original"]
+            log.info(f"*** dryrun: create local {job['downloaded_path']}")
+            with open(job["downloaded_path"], "w") as f:
+                f.write("")
+            time.sleep(1)
+
+    except Exception as e:
+        log.warning(f"    Download failed: {e}")
+        return f"FAILED-DOWNLOAD {date.date()} {filename}"
+
+    return None
+
+
+def _forkserver_context():
+    """
+    Start worker processes from a forkserver: both the day pool and each day's
+    conversion pool are created while other threads are running (the logging
+    listener, the download and upload workers), and forking a multi-threaded
+    process can deadlock. Preloading converter imports xarray/zarr once in the
+    server rather than in every worker.
+    """
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["converter"])
+    return ctx
+
+
+def _convert_stage(job: dict, convert_pool: ProcessPoolExecutor) -> str | None:
+    date, filename = job["date"], job["filename"]
+
+    # 4. Convert (CPU-bound, runs in a worker process)
+    log.info(f"   Converting {filename}...")
+    try:
+        job["converted"] = convert_pool.submit(
+            converter.extract, job["downloaded_path"], OUTPUT_FORMAT, KEEP_VARS
+        ).result()
+    except Exception as e:
+        log.warning(f"    Conversion failed: {e}")
+        return f"FAILED-CONVERT {date.date()} {filename}"
+    finally:
+        # 5. Cleanup: the archive is not needed past this point, free the
+        # disk now rather than holding it for the duration of the upload
+        try:
+            log.info(f"   Removing original {filename}...")
+            os.remove(job["downloaded_path"])
+        except OSError:
+            pass
+
+    return None
+
+
+def _upload_stage(job: dict, s3_bucket: str, dryrun: bool) -> str:
+    date, filename = job["date"], job["filename"]
+    converted = job["converted"]
+    converted_s3_key = job["converted_s3_key"]
+
+    # 6. Upload
+    log.info(f"   Uploading to S3 → {converted_s3_key}")
+    try:
+        if not dryrun:
+            upload_to_s3(converted, s3_bucket, converted_s3_key)
+        else:
+            log.info(f"*** dryrun: skip upload {filename} -> {converted_s3_key}")
+    except Exception as e:
+        log.warning(f"    Upload failed: {e}")
+        return f"FAILED-UPLOAD {date.date()} {filename}"
+    finally:
+        # Release the in-memory NetCDF
+        converted.close()
+
+    log.info(f" ✓ Completed {filename}")
+    return f"OK {date.date()} {filename}"
+
+
+def _stage_worker(in_q: queue.Queue, out_q: queue.Queue | None, handler, results: list):
+    """
+    Pull jobs from in_q until a None sentinel arrives. A handler returning
+    a result string ends the job, None forwards it to out_q.
+    """
+    while True:
+        job = in_q.get()
+        if job is None:
+            break
+        try:
+            result = handler(job)
+        except Exception as e:
+            log.warning(f"    Unexpected failure for {job['filename']}: {e}")
+            result = f"FAILED {job['date'].date()} {job['filename']}"
+        if result is not None:
+            results.append(result)
+        else:
+            out_q.put(job)
+
+
+def _start_workers(count: int, *args) -> list[threading.Thread]:
+    threads = [
+        threading.Thread(target=_stage_worker, args=args, daemon=True)
+        for _ in range(count)
+    ]
+    for t in threads:
+        t.start()
+    return threads
+
+
+def _drain(threads: list[threading.Thread], q: queue.Queue):
+    """Send one sentinel per worker and wait for the stage to finish."""
+    for _ in threads:
+        q.put(None)
+    for t in threads:
+        t.join()
+
+
+def _copy_from_fallbacks(
+    s3,
+    jobs: list[dict],
+    date: datetime,
+    s3_bucket: str,
+    s3_prefix: str,
+    fallback_prefixes: list[str],
+    dryrun: bool,
+    results: list,
+) -> list[dict]:
+    """
+    Server-side copy the outputs already produced under a fallback prefix
+    (e.g. by a previous run under another key). Returns the jobs that still
+    need the full download/convert/upload pipeline.
+    """
+    day_path = f"{date.year}/{date.month:02d}/{date.day:02d}/"
+    fallback_keys = [
+        (prefix, list_s3_keys(s3, s3_bucket, f"{prefix}/{day_path}"))
+        for prefix in fallback_prefixes
+    ]
+
+    remaining = []
+    copies = []
+    for job in jobs:
+        relative_key = job["converted_s3_key"][len(s3_prefix) :]
+        alt_key = next(
+            (
+                f"{prefix}{relative_key}"
+                for prefix, keys in fallback_keys
+                if f"{prefix}{relative_key}" in keys
+            ),
+            None,
+        )
+        if alt_key is None:
+            remaining.append(job)
+            continue
+
+        log.info(f"   Copying in S3 {alt_key} → {job['converted_s3_key']}")
+        if dryrun:
+            log.info(f"*** dryrun: skip copy {alt_key} -> {job['converted_s3_key']}")
+            results.append(f"COPIED {date.date()} {job['filename']}")
+            continue
+        copies.append((job, copy_in_s3(s3_bucket, alt_key, job["converted_s3_key"])))
+
+    for job, future in copies:
+        try:
+            future.result()
+            results.append(f"COPIED {date.date()} {job['filename']}")
+        except Exception as e:
+            log.warning(f"    Copy failed, processing {job['filename']} instead: {e}")
+            remaining.append(job)
+
+    return remaining
+
+
+# -------------------------------------------------------------------
+# Process one single day (pipelined)
 # -------------------------------------------------------------------
 
 
@@ -96,106 +621,126 @@ def process_single_day(
     s3_prefix: str,
     force: bool,
     dryrun: bool = False,
+    hf_files: list[str] | None = None,
+    fallback_prefixes: list[str] | None = None,
 ):
 
     if dryrun:
-        print("**** Running in dryrun mode ****")
+        log.info("**** Running in dryrun mode ****")
 
-    yyyy, mm, dd = date.year, date.month, date.day
-    print(f"\n=== {date.date()} ===")
+    log.info(f"\n=== {date.date()} ===")
 
-    # 1. List files available for this date
-    hf_files = list_hf_files_for_date(api, repo_id, date)
+    # 1. List files available for this date, unless already prefetched
+    if hf_files is None:
+        hf_files = list_hf_files_for_date(api, repo_id, date)
 
     if not hf_files:
-        print(" No files found for this date on HF")
+        log.info(" No files found for this date on HF")
         return []
 
     results = []
 
-    for remote_path in hf_files:
-        filename = os.path.basename(remote_path)
-
-        local_dir = os.path.join(local_root, f"{yyyy}/{mm}/{dd}")
-        os.makedirs(local_dir, exist_ok=True)
+    download_q: queue.Queue = queue.Queue()
+    # Bounded so downloads wait for conversion instead of piling archives on disk
+    convert_q: queue.Queue = queue.Queue(maxsize=CONVERT_WORKERS)
+    upload_q: queue.Queue = queue.Queue()
 
-        local_original = os.path.join(local_dir, filename)
-        converted_filename = filename.replace(".zarr.zip", ".nc")
-        converted_local = os.path.join(local_dir, converted_filename)
-
-        converted_s3_key = f"{s3_prefix}/{yyyy}/{mm:02d}/{dd:02d}/{converted_filename}"
-
-        print(f"\n → Processing file: {filename}")
-
-        # 2. Skip if this file is already converted and uploaded
-        if not force and s3_key_exists(s3, s3_bucket, converted_s3_key):
-            print(f" ✓ Already in S3, skipping → {converted_s3_key}")
-            results.append(f"SKIPPED {date.date()} {filename}")
-            continue
-
-        # 3. Download
-        print(f"   Downloading HF file: {remote_path}")
-        try:
-            temp_local_dir = "./"
-            if not dryrun:
-                downloaded_path = hf_hub_download(
-                    repo_id=repo_id,
-                    filename=remote_path,
-                    repo_type="dataset",
-                    local_dir=temp_local_dir,
-                    force_download=force,
-                )
-            else:
-                downloaded_path = local_original
-                print(f"*** dryrun: create local {downloaded_path}")
-                with open(downloaded_path, "w") as f:
-                    f.write("")
-                time.sleep(1)
+    # 2. Skip files already converted and uploaded, one listing for the whole day
+    existing = set()
+    if not force:
+        day_prefix = f"{s3_prefix}/{date.year}/{date.month:02d}/{date.day:02d}/"
+        existing = list_s3_keys(s3, s3_bucket, day_prefix)
 
-        except Exception as e:
-            print(f"    Download failed: {e}")
-            results.append(f"FAILED-DOWNLOAD {date.date()} {filename}")
-            continue
-
-        # 4. Convert
-        print(f"   Converting...")
-        try:
-            converted_path = converter.extract(downloaded_path)
-        except Exception as e:
-            print(f"    Conversion failed: {e}")
-            results.append(f"FAILED-CONVERT {date.date()} {filename}")
+    jobs = []
+    for remote_path in hf_files:
+        job = _build_job(remote_path, date, local_root, s3_prefix)
+        if job["converted_s3_key"] in existing:
+            log.info(f" ✓ Already in S3, skipping → {job['converted_s3_key']}")
+            results.append(f"SKIPPED {date.date()} {job['filename']}")
             continue
+        jobs.append(job)
 
-        # 5. Upload
-        print(f"   Uploading to S3 → {converted_s3_key}")
-        try:
-            if not dryrun:
-                upload_to_s3(s3, converted_path, s3_bucket, converted_s3_key)
-            else:
-                print(f"*** dryrun: skip upload {converted_path} -> {converted_s3_key}")
-        except Exception as e:
-            print(f"    Upload failed: {e}")
-            results.append(f"FAILED-UPLOAD {date.date()} {filename}")
-            continue
+    # 2b. Copy outputs found under a fallback prefix instead of rebuilding them
+    if not force and fallback_prefixes:
+        jobs = _copy_from_fallbacks(
+            s3, jobs, date, s3_bucket, s3_prefix, fallback_prefixes, dryrun, results
+        )
 
-        # 6. Cleanup
-        try:
-            print(f"   Removing original...")
-            os.remove(local_original)
-        except OSError:
-            pass
+    for job in jobs:
+        download_q.put(job)
+
+    with ProcessPoolExecutor(
+        max_workers=CONVERT_WORKERS, mp_context=_forkserver_context()
+    ) as convert_pool:
+        downloaders = _start_workers(
+            DOWNLOAD_WORKERS,
+            download_q,
+            convert_q,
+            lambda job: _download_stage(job, repo_id, force, dryrun),
+            results,
+        )
+        converters = _start_workers(
+            CONVERT_WORKERS,
+            convert_q,
+            upload_q,
+            lambda job: _convert_stage(job, convert_pool),
+            results,
+        )
+        uploaders = _start_workers(
+            UPLOAD_WORKERS,
+            upload_q,
+            None,
+            lambda job: _upload_stage(job, s3_bucket, dryrun),
+            results,
+        )
 
-        print(f" ✓ Completed {filename}")
-        results.append(f"OK {date.date()} {filename}")
+        # Shut the stages down in order once upstream has drained
+        _drain(downloaders, download_q)
+        _drain(converters, convert_q)
+        _drain(uploaders, upload_q)
 
     return results
 
 
 # -------------------------------------------------------------------
-# Sequential controller
+# Parallel controller (one process per day)
 # -------------------------------------------------------------------
 
 
+def _day_worker(
+    day: tuple[datetime, list[str] | None],
+    repo_id: str,
+    local_root: str,
+    s3_bucket: str,
+    s3_prefix: str,
+    force: bool,
+    dryrun: bool = False,
+    fallback_prefixes: list[str] | None = None,
+):
+    """
+    Runs one day in a worker process. Clients and logging are set up here,
+    the worker starts from the forkserver without the parent's state.
+    """
+    date, hf_files = day
+    listener = setup_logging()
+    try:
+        return process_single_day(
+            s3=get_s3_client(),
+            api=HfApi(),
+            repo_id=repo_id,
+            date=date,
+            local_root=local_root,
+            s3_bucket=s3_bucket,
+            s3_prefix=s3_prefix,
+            force=force,
+            dryrun=dryrun,
+            hf_files=hf_files,
+            fallback_prefixes=fallback_prefixes,
+        )
+    finally:
+        listener.stop()
+
+
 def run_pipeline(
     repo_id: str,
     start_date: str,
@@ -205,39 +750,55 @@ def run_pipeline(
     s3_prefix: str,
     force: bool,
     dryrun: bool = False,
+    fallback_prefixes: list[str] | None = None,
 ):
 
-    print("Starting DWD HF Exporter Pipeline")
+    log.info("Starting DWD HF Exporter Pipeline")
     api = HfApi()
-    s3 = get_s3_client()
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
 
-    print("Dates:", start.date(), "to", end.date())
+    log.info(f"Dates: {start.date()} to {end.date()}")
+
+    dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+    # One HF listing per month traversed instead of one per day
+    month_files: dict[tuple[int, int], dict[int, list[str]] | None] = {}
+    for date in dates:
+        month = (date.year, date.month)
+        if month not in month_files:
+            month_files[month] = list_hf_files_for_month(api, repo_id, *month)
+
+    # A month whose listing failed passes None, so each day lists itself
+    days = []
+    for date in dates:
+        files_by_day = month_files[(date.year, date.month)]
+        hf_files = None if files_by_day is None else files_by_day.get(date.day, [])
+        days.append((date, hf_files))
+
+    day_worker = partial(
+        _day_worker,
+        repo_id=repo_id,
+        local_root=local_root,
+        s3_bucket=s3_bucket,
+        s3_prefix=s3_prefix,
+        force=force,
+        dryrun=dryrun,
+        fallback_prefixes=fallback_prefixes,
+    )
 
-    date = start
     results = []
 
-    while date <= end:
-        print(f"\nProcessing date: {date.date()}")
-        day_results = process_single_day(
-            s3=s3,
-            api=api,
-            repo_id=repo_id,
-            date=date,
-            local_root=local_root,
-            s3_bucket=s3_bucket,
-            s3_prefix=s3_prefix,
-            force=force,
-            dryrun=dryrun,
-        )
-        results.extend(day_results)
-        date += timedelta(days=1)
+    with ProcessPoolExecutor(
+        max_workers=DAY_WORKERS, mp_context=_forkserver_context()
+    ) as executor:
+        for day_results in executor.map(day_worker, days):
+            results.extend(day_results)
 
-    print("\n=== SUMMARY ===")
+    log.info("\n=== SUMMARY ===")
     for r in results:
-        print(r)
+        log.info(r)
 
 
 # -------------------------------------------------------------------
@@ -245,14 +806,19 @@ def run_pipeline(
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
-    print("DWD HF Exporter main.py")
-    run_pipeline(
-        repo_id="openclimatefix/dwd-icon-eu",
-        start_date="2025-07-01",
-        end_date="2025-08-31",
-        local_root="./data",
-        s3_bucket="celine-pipelines-dwd",
-        s3_prefix="openclimatefix--dwd-icon-eu",
-        force=False,
-        dryrun=False,
-    )
+    listener = setup_logging()
+    log.info("DWD HF Exporter main.py")
+    try:
+        run_pipeline(
+            repo_id="openclimatefix/dwd-icon-eu",
+            start_date="2025-07-01",
+            end_date="2025-08-31",
+            local_root="./data",
+            s3_bucket="celine-pipelines-dwd",
+            s3_prefix="openclimatefix--dwd-icon-eu",
+            force=False,
+            dryrun=False,
+            fallback_prefixes=[],
+        )
+    finally:
+        listener.stop()